@@ -1,7 +1,10 @@
+from bisect import bisect_right
+from collections import Counter
 from dataclasses import dataclass
+from functools import lru_cache
 import logging
 import sqlite3
-from typing import Any, List
+from typing import Any, Iterable, List, Tuple
 
 from boxing.utils.sql_utils import get_db_connection
 from boxing.utils.logger import configure_logger
@@ -11,7 +14,38 @@ logger = logging.getLogger(__name__)
 configure_logger(logger)
 
 
-@dataclass
+# SQL statements are module constants so each call passes the same string and
+# hits the connection's prepared statement cache instead of re-parsing it.
+# Pooled connections are in autocommit mode, so single-statement writes commit
+# on their own and only multi-statement writes open an explicit transaction.
+_INSERT_BOXER_SQL = """
+    INSERT INTO boxers (name, weight, height, reach, age)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(name) DO NOTHING
+"""
+_DELETE_BOXER_SQL = "DELETE FROM boxers WHERE id = ?"
+_GET_BOXER_BY_ID_SQL = "SELECT id, name, weight, height, reach, age FROM boxers WHERE id = ?"
+_GET_BOXER_BY_NAME_SQL = "SELECT id, name, weight, height, reach, age FROM boxers WHERE name = ?"
+_BOXER_EXISTS_SQL = "SELECT 1 FROM boxers WHERE id = ?"
+_BOXER_NAME_EXISTS_SQL = "SELECT 1 FROM boxers WHERE name = ?"
+_RECORD_WIN_SQL = "UPDATE boxers SET fights = fights + 1, wins = wins + 1 WHERE id = ?"
+_RECORD_LOSS_SQL = "UPDATE boxers SET fights = fights + 1 WHERE id = ?"
+_RECORD_RESULT_SQL = "UPDATE boxers SET fights = fights + 1, wins = wins + CASE WHEN ? THEN 1 ELSE 0 END WHERE id = ?"
+
+_LEADERBOARD_SQL = """
+    SELECT id, name, weight, height, reach, age, fights, wins,
+           ROUND(wins * 100.0 / fights, 1) AS win_pct
+    FROM boxers
+    WHERE fights > 0
+"""
+_LEADERBOARD_SQL_BY_SORT = {
+    # Sort on the unrounded ratio so ties from rounding keep their true order
+    'win_pct': _LEADERBOARD_SQL + " ORDER BY wins * 1.0 / fights DESC",
+    'wins': _LEADERBOARD_SQL + " ORDER BY wins DESC",
+}
+
+
+@dataclass(slots=True, frozen=True)
 class Boxer:
     id: int
     name: str
@@ -22,11 +56,11 @@ class Boxer:
     weight_class: str = None
 
     def __post_init__(self):
-        self.weight_class = get_weight_class(self.weight)  # Automatically assign weight class
+        # The dataclass is frozen, so weight_class is set through object.__setattr__
+        object.__setattr__(self, 'weight_class', get_weight_class(self.weight))  # Automatically assign weight class
 
 
-def create_boxer(name: str, weight: int, height: int, reach: float, age: int) -> None:
-
+def _validate_boxer(weight: int, height: int, reach: float, age: int) -> None:
     if weight < 125:
         raise ValueError(f"Invalid weight: {weight}. Must be at least 125.")
     if height <= 0:
@@ -36,24 +70,54 @@ def create_boxer(name: str, weight: int, height: int, reach: float, age: int) ->
     if not (18 <= age <= 40):
         raise ValueError(f"Invalid age: {age}. Must be between 18 and 40.")
 
+
+def create_boxer(name: str, weight: int, height: int, reach: float, age: int) -> None:
+
+    _validate_boxer(weight, height, reach, age)
+
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
 
-            # Check if the boxer already exists (name must be unique)
-            cursor.execute("SELECT 1 FROM boxers WHERE name = ?", (name,))
-            if cursor.fetchone():
+            # Nothing is inserted if the name is taken (name must be unique)
+            cursor.execute(_INSERT_BOXER_SQL, (name, weight, height, reach, age))
+            if cursor.rowcount == 0:
                 raise ValueError(f"Boxer with name '{name}' already exists")
 
-            cursor.execute("""
-                INSERT INTO boxers (name, weight, height, reach, age)
-                VALUES (?, ?, ?, ?, ?)
-            """, (name, weight, height, reach, age))
+    except sqlite3.IntegrityError as e:
+        # Duplicate names are handled by ON CONFLICT, so this is another constraint
+        raise ValueError(f"Invalid boxer '{name}': {e}")
+
+    except sqlite3.Error as e:
+        raise e
+
+
+def create_boxers_bulk(boxers: Iterable[Tuple[str, int, int, float, int]]) -> None:
+    boxers = list(boxers)
+    for name, weight, height, reach, age in boxers:
+        _validate_boxer(weight, height, reach, age)
+
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+
+            # Insert every boxer in a single transaction so there is only one commit
+            conn.execute("BEGIN")
+            cursor.executemany(_INSERT_BOXER_SQL, boxers)
+            if cursor.rowcount != len(boxers):
+                conn.rollback()
+                names = [boxer[0] for boxer in boxers]
+                counts = Counter(names)
+                conflicts = [
+                    name for name in dict.fromkeys(names)
+                    if counts[name] > 1 or cursor.execute(_BOXER_NAME_EXISTS_SQL, (name,)).fetchone()
+                ]
+                raise ValueError(f"Boxers already exist: {conflicts}")
 
             conn.commit()
 
-    except sqlite3.IntegrityError:
-        raise ValueError(f"Boxer with name '{name}' already exists")
+    except sqlite3.IntegrityError as e:
+        raise ValueError(f"Invalid boxer data: {e}")
 
     except sqlite3.Error as e:
         raise e
@@ -64,55 +128,33 @@ def delete_boxer(boxer_id: int) -> None:
         with get_db_connection() as conn:
             cursor = conn.cursor()
 
-            cursor.execute("SELECT id FROM boxers WHERE id = ?", (boxer_id,))
-            if cursor.fetchone() is None:
+            cursor.execute(_DELETE_BOXER_SQL, (boxer_id,))
+            if cursor.rowcount == 0:
                 raise ValueError(f"Boxer with ID {boxer_id} not found.")
 
-            cursor.execute("DELETE FROM boxers WHERE id = ?", (boxer_id,))
-            conn.commit()
-
     except sqlite3.Error as e:
         raise e
 
 
 def get_leaderboard(sort_by: str = "wins") -> List[dict[str, Any]]:
-    query = """
-        SELECT id, name, weight, height, reach, age, fights, wins,
-               (wins * 1.0 / fights) AS win_pct
-        FROM boxers
-        WHERE fights > 0
-    """
-
-    if sort_by == "win_pct":
-        query += " ORDER BY win_pct DESC"
-    elif sort_by == "wins":
-        query += " ORDER BY wins DESC"
-    else:
+    query = _LEADERBOARD_SQL_BY_SORT.get(sort_by)
+    if query is None:
         raise ValueError(f"Invalid sort_by parameter: {sort_by}")
 
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             cursor.execute(query)
             rows = cursor.fetchall()
 
-        leaderboard = []
-        for row in rows:
-            boxer = {
-                'id': row[0],
-                'name': row[1],
-                'weight': row[2],
-                'height': row[3],
-                'reach': row[4],
-                'age': row[5],
-                'weight_class': get_weight_class(row[2]),  # Calculate weight class
-                'fights': row[6],
-                'wins': row[7],
-                'win_pct': round(row[8] * 100, 1)  # Convert to percentage
+        return [
+            {
+                **dict(row),
+                'weight_class': get_weight_class(row['weight'])  # Calculate weight class
             }
-            leaderboard.append(boxer)
-
-        return leaderboard
+            for row in rows
+        ]
 
     except sqlite3.Error as e:
         raise e
@@ -122,10 +164,7 @@ def get_boxer_by_id(boxer_id: int) -> Boxer:
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT id, name, weight, height, reach, age
-                FROM boxers WHERE id = ?
-            """, (boxer_id,))
+            cursor.execute(_GET_BOXER_BY_ID_SQL, (boxer_id,))
 
             row = cursor.fetchone()
 
@@ -146,10 +185,7 @@ def get_boxer_by_name(boxer_name: str) -> Boxer:
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT id, name, weight, height, reach, age
-                FROM boxers WHERE name = ?
-            """, (boxer_name,))
+            cursor.execute(_GET_BOXER_BY_NAME_SQL, (boxer_name,))
 
             row = cursor.fetchone()
 
@@ -166,19 +202,17 @@ def get_boxer_by_name(boxer_name: str) -> Boxer:
         raise e
 
 
+# Lower bound of each weight class, in ascending order
+_WEIGHT_CLASS_BINS = (125, 133, 166, 203)
+_WEIGHT_CLASSES = ('FEATHERWEIGHT', 'LIGHTWEIGHT', 'MIDDLEWEIGHT', 'HEAVYWEIGHT')
+
+
+@lru_cache(maxsize=None)
 def get_weight_class(weight: int) -> str:
-    if weight >= 203:
-        weight_class = 'HEAVYWEIGHT'
-    elif weight >= 166:
-        weight_class = 'MIDDLEWEIGHT'
-    elif weight >= 133:
-        weight_class = 'LIGHTWEIGHT'
-    elif weight >= 125:
-        weight_class = 'FEATHERWEIGHT'
-    else:
+    index = bisect_right(_WEIGHT_CLASS_BINS, weight) - 1
+    if index < 0:
         raise ValueError(f"Invalid weight: {weight}. Weight must be at least 125.")
-
-    return weight_class
+    return _WEIGHT_CLASSES[index]
 
 
 def update_boxer_stats(boxer_id: int, result: str) -> None:
@@ -189,14 +223,39 @@ def update_boxer_stats(boxer_id: int, result: str) -> None:
         with get_db_connection() as conn:
             cursor = conn.cursor()
 
-            cursor.execute("SELECT id FROM boxers WHERE id = ?", (boxer_id,))
-            if cursor.fetchone() is None:
-                raise ValueError(f"Boxer with ID {boxer_id} not found.")
-
             if result == 'win':
-                cursor.execute("UPDATE boxers SET fights = fights + 1, wins = wins + 1 WHERE id = ?", (boxer_id,))
+                cursor.execute(_RECORD_WIN_SQL, (boxer_id,))
             else:  # result == 'loss'
-                cursor.execute("UPDATE boxers SET fights = fights + 1 WHERE id = ?", (boxer_id,))
+                cursor.execute(_RECORD_LOSS_SQL, (boxer_id,))
+
+            if cursor.rowcount == 0:
+                raise ValueError(f"Boxer with ID {boxer_id} not found.")
+
+    except sqlite3.Error as e:
+        raise e
+
+
+def update_boxer_stats_bulk(updates: List[Tuple[int, str]]) -> None:
+    for boxer_id, result in updates:
+        if result not in {'win', 'loss'}:
+            raise ValueError(f"Invalid result: {result}. Expected 'win' or 'loss'.")
+
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+
+            # Apply every update in a single transaction so there is only one commit
+            conn.execute("BEGIN")
+            cursor.executemany(
+                _RECORD_RESULT_SQL,
+                [(1 if result == 'win' else 0, boxer_id) for boxer_id, result in updates]
+            )
+            if cursor.rowcount != len(updates):
+                missing = [
+                    boxer_id for boxer_id, _ in updates
+                    if cursor.execute(_BOXER_EXISTS_SQL, (boxer_id,)).fetchone() is None
+                ]
+                raise ValueError(f"Boxers not found: {missing}")
 
             conn.commit()
 
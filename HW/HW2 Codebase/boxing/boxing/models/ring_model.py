@@ -1,10 +1,10 @@
 import logging
-import math
-from typing import List
+from typing import Optional, Tuple
 
-from boxing.models.boxers_model import Boxer, update_boxer_stats
+from boxing.models.boxers_model import Boxer, update_boxer_stats_bulk
 from boxing.utils.logger import configure_logger
 from boxing.utils.api_utils import get_random
+from boxing.utils.fight_kernel import win_probability
 
 
 logger = logging.getLogger(__name__)
@@ -13,59 +13,55 @@ configure_logger(logger)
 
 class RingModel:
     def __init__(self):
-        self.ring: List[Boxer] = []
+        # The ring holds at most two boxers, filled in order
+        self._a: Optional[Boxer] = None
+        self._b: Optional[Boxer] = None
 
     def fight(self) -> str:
-        if len(self.ring) < 2:
+        if self._b is None:
             raise ValueError("There must be two boxers to start a fight.")
 
-        boxer_1, boxer_2 = self.get_boxers()
+        boxer_1, boxer_2 = self._a, self._b
 
         skill_1 = self.get_fighting_skill(boxer_1)
         skill_2 = self.get_fighting_skill(boxer_2)
 
-        # Compute the absolute skill difference
-        # And normalize using a logistic function for better probability scaling
-        delta = abs(skill_1 - skill_2)
-        normalized_delta = 1 / (1 + math.e ** (-delta))
+        normalized_delta = win_probability(skill_1, skill_2)
 
-        random_number = get_random()
-
-        if random_number < normalized_delta:
+        # A lopsided fight can't be changed by the draw, so don't ask random.org
+        if normalized_delta == 1.0 or get_random() < normalized_delta:
             winner = boxer_1
             loser = boxer_2
         else:
             winner = boxer_2
             loser = boxer_1
 
-        update_boxer_stats(winner.id, 'win')
-        update_boxer_stats(loser.id, 'loss')
+        update_boxer_stats_bulk([(winner.id, 'win'), (loser.id, 'loss')])
 
         self.clear_ring()
 
         return winner.name
 
     def clear_ring(self):
-        if not self.ring:
-            return
-        self.ring.clear()
+        self._a = self._b = None
 
     def enter_ring(self, boxer: Boxer):
         if not isinstance(boxer, Boxer):
             raise TypeError(f"Invalid type: Expected 'Boxer', got '{type(boxer).__name__}'")
 
-        if len(self.ring) >= 2:
-            raise ValueError("Ring is full, cannot add more boxers.")
-
-        self.ring.append(boxer)
-
-    def get_boxers(self) -> List[Boxer]:
-        if not self.ring:
-            pass
+        if self._a is None:
+            self._a = boxer
+        elif self._b is None:
+            self._b = boxer
         else:
-            pass
+            raise ValueError("Ring is full, cannot add more boxers.")
 
-        return self.ring
+    def get_boxers(self) -> Tuple[Boxer, ...]:
+        if self._b is not None:
+            return (self._a, self._b)
+        if self._a is not None:
+            return (self._a,)
+        return ()
 
     def get_fighting_skill(self, boxer: Boxer) -> float:
         # Arbitrary calculations
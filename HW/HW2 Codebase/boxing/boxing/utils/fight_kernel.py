@@ -0,0 +1,11 @@
+import math
+
+
+def win_probability(skill_1: float, skill_2: float) -> float:
+    # Normalize the absolute skill difference with a logistic function. Past a
+    # difference of 20 the curve is within 1e-9 of 1.0, so return exactly 1.0
+    # and let the caller skip the random draw.
+    delta = abs(skill_1 - skill_2)
+    if delta > 20:
+        return 1.0
+    return 1.0 / (1.0 + math.exp(-delta))
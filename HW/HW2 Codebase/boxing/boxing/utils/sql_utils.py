@@ -1,7 +1,9 @@
 from contextlib import contextmanager
 import logging
 import os
+import queue
 import sqlite3
+import threading
 
 from boxing.utils.logger import configure_logger
 
@@ -12,6 +14,9 @@ configure_logger(logger)
 
 # load the db path from the environment with a default value
 DB_PATH = os.getenv("DB_PATH", "/app/sql/boxing.db")
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", "1"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
 
 
 def check_database_connection():
@@ -47,14 +52,129 @@ def check_table_exists(tablename: str):
         error_message = f"Table check error for '{tablename}': {e}"
         raise Exception(error_message) from e
 
+class ConnectionPool:
+    """Bounded LIFO pool of pre-configured SQLite connections.
+
+    Reusing connections keeps each connection's page cache warm across calls
+    instead of paying for a fresh connect + pragma setup every time.
+    """
+
+    def __init__(self, db_path: str, max_size: int = 5, min_size: int = 1, timeout: float = 30):
+        self.db_path = db_path
+        self.max_size = max_size
+        self.min_size = min(min_size, max_size)
+        self.timeout = timeout
+        self._pool = queue.LifoQueue(maxsize=max_size)
+        self._lock = threading.Lock()
+        self._created = 0
+        self._initialized = False
+
+    def _create_connection(self) -> sqlite3.Connection:
+        # Autocommit mode: reads and single-statement writes run without an
+        # implicit BEGIN/COMMIT, multi-statement writes issue their own BEGIN
+        conn = sqlite3.connect(
+            self.db_path, isolation_level=None, check_same_thread=False, cached_statements=256
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=memory")
+        conn.execute("PRAGMA cache_size=-64000")
+        self._created += 1
+        return conn
+
+    def _initialize(self):
+        with self._lock:
+            if self._initialized:
+                return
+            for _ in range(self.min_size):
+                self._pool.put_nowait(self._create_connection())
+            self._initialized = True
+
+    def get(self) -> sqlite3.Connection:
+        if not self._initialized:
+            self._initialize()
+
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if self._created < self.max_size:
+                return self._create_connection()
+
+        # Pool is at capacity, wait for a connection to be returned
+        try:
+            return self._pool.get(timeout=self.timeout)
+        except queue.Empty:
+            raise sqlite3.OperationalError(
+                f"Timed out after {self.timeout}s waiting for a database connection "
+                f"({self.max_size} connections in use)"
+            )
+
+    def put(self, conn: sqlite3.Connection):
+        try:
+            self._pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+            with self._lock:
+                self._created -= 1
+
+    def discard(self, conn: sqlite3.Connection):
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+        with self._lock:
+            self._created -= 1
+
+    def close_all(self):
+        with self._lock:
+            while True:
+                try:
+                    conn = self._pool.get_nowait()
+                except queue.Empty:
+                    break
+                conn.close()
+                self._created -= 1
+            self._initialized = False
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> ConnectionPool:
+    global _pool
+
+    # Created lazily, and recreated if DB_PATH has been changed since
+    pool = _pool
+    if pool is None or pool.db_path != DB_PATH:
+        with _pool_lock:
+            if _pool is None or _pool.db_path != DB_PATH:
+                if _pool is not None:
+                    _pool.close_all()
+                _pool = ConnectionPool(
+                    DB_PATH, max_size=DB_POOL_SIZE, min_size=DB_POOL_MIN_SIZE, timeout=DB_POOL_TIMEOUT
+                )
+            pool = _pool
+
+    return pool
+
+
 @contextmanager
 def get_db_connection():
-    conn = None
+    pool = _get_pool()
+    conn = pool.get()
     try:
-        conn = sqlite3.connect(DB_PATH)
         yield conn
-    except sqlite3.Error as e:
-        raise e
     finally:
-        if conn:
-            conn.close()
+        try:
+            # Roll back anything left uncommitted (including on error) so the
+            # connection goes back to the pool clean, as closing it used to
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            pool.discard(conn)
+        else:
+            pool.put(conn)
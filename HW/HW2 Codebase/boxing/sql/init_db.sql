@@ -11,3 +11,6 @@ CREATE TABLE boxers (
 );
 
 CREATE UNIQUE INDEX idx_boxers_name ON boxers(name);
+
+-- Lets the leaderboard read boxers in win order instead of sorting the table
+CREATE INDEX idx_boxers_wins ON boxers(wins DESC) WHERE fights > 0;
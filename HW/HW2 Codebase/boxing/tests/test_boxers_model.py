@@ -0,0 +1,286 @@
+import copy
+from dataclasses import asdict, FrozenInstanceError
+import os
+import pickle
+import sqlite3
+
+import pytest
+
+from boxing.models.boxers_model import (
+    Boxer,
+    create_boxer,
+    create_boxers_bulk,
+    delete_boxer,
+    get_leaderboard,
+    get_weight_class,
+    update_boxer_stats,
+    update_boxer_stats_bulk
+)
+from boxing.utils import sql_utils
+
+
+INIT_DB_SQL = os.path.join(os.path.dirname(__file__), "..", "sql", "init_db.sql")
+
+
+######################################################
+#
+#    Fixtures
+#
+######################################################
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    """Point sql_utils at a fresh database created from sql/init_db.sql."""
+    path = str(tmp_path / "boxing.db")
+    conn = sqlite3.connect(path)
+    with open(INIT_DB_SQL) as f:
+        conn.executescript(f.read())
+    conn.close()
+
+    monkeypatch.setattr(sql_utils, "DB_PATH", path)
+    return path
+
+
+@pytest.fixture
+def two_boxers(db_path):
+    """Add two boxers, with IDs 1 and 2."""
+    create_boxer("Boxer 1", 150, 70, 72.0, 28)
+    create_boxer("Boxer 2", 210, 76, 80.0, 30)
+
+
+def get_names(db_path: str) -> list:
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute("SELECT name FROM boxers ORDER BY id").fetchall()
+    conn.close()
+    return [name for (name,) in rows]
+
+
+def get_stats(db_path: str) -> dict:
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute("SELECT id, fights, wins FROM boxers ORDER BY id").fetchall()
+    conn.close()
+    return {boxer_id: (fights, wins) for boxer_id, fights, wins in rows}
+
+
+######################################################
+#
+#    Boxer
+#
+######################################################
+
+
+@pytest.fixture
+def sample_boxer():
+    return Boxer(1, 'Boxer 1', 150, 70, 72.0, 28)
+
+
+def test_boxer_weight_class(sample_boxer):
+    """Test that the weight class is assigned on construction and serialized."""
+    assert sample_boxer.weight_class == 'LIGHTWEIGHT'
+    assert asdict(sample_boxer) == {
+        'id': 1, 'name': 'Boxer 1', 'weight': 150, 'height': 70,
+        'reach': 72.0, 'age': 28, 'weight_class': 'LIGHTWEIGHT'
+    }
+
+
+@pytest.mark.parametrize("weight, weight_class", [
+    (125, 'FEATHERWEIGHT'),
+    (132.9, 'FEATHERWEIGHT'),
+    (133, 'LIGHTWEIGHT'),
+    (165.9, 'LIGHTWEIGHT'),
+    (166, 'MIDDLEWEIGHT'),
+    (202.9, 'MIDDLEWEIGHT'),
+    (203, 'HEAVYWEIGHT'),
+    (250, 'HEAVYWEIGHT'),
+])
+def test_get_weight_class(weight, weight_class):
+    """Test weight classes on both sides of each boundary."""
+    assert get_weight_class(weight) == weight_class
+
+
+@pytest.mark.parametrize("weight", [124, 124.9])
+def test_get_weight_class_too_light(weight):
+    """Test that weights below 125 have no weight class."""
+    with pytest.raises(ValueError, match=f"Invalid weight: {weight}. Weight must be at least 125."):
+        get_weight_class(weight)
+
+
+def test_boxer_is_frozen(sample_boxer):
+    """Test that a boxer can't be modified after construction."""
+    with pytest.raises(FrozenInstanceError):
+        sample_boxer.weight = 210
+
+
+@pytest.mark.parametrize("clone", [
+    copy.copy,
+    copy.deepcopy,
+    lambda boxer: pickle.loads(pickle.dumps(boxer)),
+])
+def test_boxer_copy_and_pickle(sample_boxer, clone):
+    """Test that copies and unpickled boxers keep every field."""
+    boxer = clone(sample_boxer)
+
+    assert boxer == sample_boxer
+    assert boxer.weight_class == 'LIGHTWEIGHT'
+
+
+######################################################
+#
+#    Add boxers
+#
+######################################################
+
+
+def test_create_boxers_bulk(db_path):
+    """Test adding several boxers in one call."""
+    create_boxers_bulk([
+        ("Boxer 1", 150, 70, 72.0, 28),
+        ("Boxer 2", 210, 76, 80.0, 30),
+    ])
+
+    assert get_names(db_path) == ["Boxer 1", "Boxer 2"]
+
+
+def test_create_boxers_bulk_existing_name_rolls_back(db_path):
+    """Test that a name already in the table aborts the whole batch."""
+    create_boxer("Boxer 1", 150, 70, 72.0, 28)
+
+    with pytest.raises(ValueError, match=r"Boxers already exist: \['Boxer 1'\]"):
+        create_boxers_bulk([
+            ("Boxer 2", 210, 76, 80.0, 30),
+            ("Boxer 1", 160, 71, 73.0, 29),
+        ])
+
+    assert get_names(db_path) == ["Boxer 1"], "Expected no boxers from the batch to be added."
+
+
+def test_create_boxers_bulk_duplicate_in_batch_rolls_back(db_path):
+    """Test that a name repeated within the batch aborts the whole batch."""
+    with pytest.raises(ValueError, match=r"Boxers already exist: \['Boxer 1'\]"):
+        create_boxers_bulk([
+            ("Boxer 1", 150, 70, 72.0, 28),
+            ("Boxer 2", 210, 76, 80.0, 30),
+            ("Boxer 1", 160, 71, 73.0, 29),
+        ])
+
+    assert get_names(db_path) == [], "Expected no boxers from the batch to be added."
+
+
+def test_create_boxers_bulk_constraint_failure_rolls_back(db_path):
+    """Test that a constraint failure other than a duplicate name is reported as such."""
+    with pytest.raises(ValueError, match="Invalid boxer data: NOT NULL constraint failed: boxers.name"):
+        create_boxers_bulk([
+            ("Boxer 1", 150, 70, 72.0, 28),
+            (None, 210, 76, 80.0, 30),
+        ])
+
+    assert get_names(db_path) == [], "Expected no boxers from the batch to be added."
+
+
+def test_create_boxers_bulk_invalid_boxer(db_path):
+    """Test that an invalid boxer rejects the batch before anything is written."""
+    with pytest.raises(ValueError, match="Invalid age: 41"):
+        create_boxers_bulk([
+            ("Boxer 1", 150, 70, 72.0, 28),
+            ("Boxer 2", 210, 76, 80.0, 41),
+        ])
+
+    assert get_names(db_path) == [], "Expected no boxers from the batch to be added."
+
+
+######################################################
+#
+#    Fight results
+#
+######################################################
+
+
+def test_update_boxer_stats_bulk(db_path, two_boxers):
+    """Test recording a win and a loss in one call."""
+    update_boxer_stats_bulk([(1, 'win'), (2, 'loss')])
+
+    assert get_stats(db_path) == {1: (1, 1), 2: (1, 0)}
+
+
+def test_update_boxer_stats_bulk_missing_boxer_rolls_back(db_path, two_boxers):
+    """Test that a missing boxer aborts the whole batch and is the only ID reported."""
+    with pytest.raises(ValueError, match=r"Boxers not found: \[999\]"):
+        update_boxer_stats_bulk([(1, 'win'), (999, 'loss')])
+
+    assert get_stats(db_path) == {1: (0, 0), 2: (0, 0)}, "Expected no stats to be updated."
+
+
+def test_update_boxer_stats_bulk_invalid_result(db_path, two_boxers):
+    """Test that an invalid result is rejected before anything is written."""
+    with pytest.raises(ValueError, match="Invalid result: draw"):
+        update_boxer_stats_bulk([(1, 'win'), (2, 'draw')])
+
+    assert get_stats(db_path) == {1: (0, 0), 2: (0, 0)}
+
+
+######################################################
+#
+#    Leaderboard
+#
+######################################################
+
+
+def test_get_leaderboard_win_pct_rounding(db_path, two_boxers):
+    """Test that win_pct is rounded by SQLite, which rounds halves away from zero.
+
+    1 win in 16 fights is 6.25%, which SQLite rounds to 6.3 (Python's round gives 6.2).
+
+    """
+    conn = sqlite3.connect(db_path)
+    conn.execute("UPDATE boxers SET fights = 16, wins = 1 WHERE id = 1")
+    conn.commit()
+    conn.close()
+
+    leaderboard = get_leaderboard("win_pct")
+
+    assert leaderboard[0]['id'] == 1
+    assert leaderboard[0]['win_pct'] == 6.3
+
+
+######################################################
+#
+#    Single-statement writes
+#
+######################################################
+
+
+def test_create_boxer_duplicate(db_path, two_boxers):
+    """Test adding a boxer whose name is taken."""
+    with pytest.raises(ValueError, match="Boxer with name 'Boxer 1' already exists"):
+        create_boxer("Boxer 1", 160, 71, 73.0, 29)
+
+
+def test_create_boxer_constraint_failure(db_path):
+    """Test that a constraint failure other than a duplicate name is reported as such."""
+    with pytest.raises(ValueError, match="Invalid boxer 'None': NOT NULL constraint failed: boxers.name"):
+        create_boxer(None, 150, 70, 72.0, 28)
+
+    assert get_names(db_path) == []
+
+
+def test_create_boxer_is_committed(db_path):
+    """Test that a new boxer is visible to other connections without an explicit commit."""
+    create_boxer("Boxer 1", 150, 70, 72.0, 28)
+
+    assert get_names(db_path) == ["Boxer 1"]
+
+
+def test_delete_boxer_missing(db_path, two_boxers):
+    """Test deleting a boxer that doesn't exist."""
+    with pytest.raises(ValueError, match="Boxer with ID 999 not found."):
+        delete_boxer(999)
+
+    assert get_names(db_path) == ["Boxer 1", "Boxer 2"]
+
+
+def test_update_boxer_stats_is_committed(db_path, two_boxers):
+    """Test that a stats update is visible to other connections without an explicit commit."""
+    update_boxer_stats(1, 'win')
+
+    assert get_stats(db_path) == {1: (1, 1), 2: (0, 0)}
@@ -0,0 +1,180 @@
+import pytest
+
+from boxing.models.boxers_model import Boxer
+from boxing.models.ring_model import RingModel
+from boxing.utils.fight_kernel import win_probability
+
+
+@pytest.fixture()
+def ring_model():
+    """Fixture to provide a new instance of RingModel for each test."""
+    return RingModel()
+
+@pytest.fixture
+def mock_update_boxer_stats_bulk(mocker):
+    """Mock the update_boxer_stats_bulk function for testing purposes."""
+    return mocker.patch("boxing.models.ring_model.update_boxer_stats_bulk")
+
+@pytest.fixture
+def mock_get_random(mocker):
+    """Mock the random.org draw, always returning 0.1."""
+    return mocker.patch("boxing.models.ring_model.get_random", return_value=0.1)
+
+"""Fixtures providing sample boxers for the tests."""
+@pytest.fixture
+def sample_boxer1():
+    return Boxer(1, 'Boxer 1', 150, 70, 72.0, 28)
+
+@pytest.fixture
+def sample_boxer2():
+    return Boxer(2, 'Boxer 2', 150, 70, 70.0, 30)
+
+
+##################################################
+# Ring Management Test Cases
+##################################################
+
+
+def test_enter_ring(ring_model, sample_boxer1, sample_boxer2):
+    """Test that boxers enter the ring in order."""
+    ring_model.enter_ring(sample_boxer1)
+    assert ring_model.get_boxers() == (sample_boxer1,)
+
+    ring_model.enter_ring(sample_boxer2)
+    assert ring_model.get_boxers() == (sample_boxer1, sample_boxer2)
+
+
+def test_enter_ring_full(ring_model, sample_boxer1, sample_boxer2):
+    """Test that a third boxer can't enter the ring."""
+    ring_model.enter_ring(sample_boxer1)
+    ring_model.enter_ring(sample_boxer2)
+
+    with pytest.raises(ValueError, match="Ring is full, cannot add more boxers."):
+        ring_model.enter_ring(Boxer(3, 'Boxer 3', 150, 70, 70.0, 30))
+
+    assert ring_model.get_boxers() == (sample_boxer1, sample_boxer2)
+
+
+def test_enter_ring_invalid_type(ring_model):
+    """Test that only Boxer instances can enter the ring."""
+    with pytest.raises(TypeError, match="Invalid type: Expected 'Boxer', got 'str'"):
+        ring_model.enter_ring("Boxer 1")
+
+    assert ring_model.get_boxers() == ()
+
+
+def test_get_boxers_empty(ring_model):
+    """Test that an empty ring has no boxers."""
+    assert ring_model.get_boxers() == ()
+
+
+def test_clear_ring_partly_filled(ring_model, sample_boxer1, sample_boxer2):
+    """Test clearing a ring with one boxer, then filling it again."""
+    ring_model.enter_ring(sample_boxer1)
+    ring_model.clear_ring()
+
+    assert ring_model.get_boxers() == ()
+
+    ring_model.enter_ring(sample_boxer2)
+    assert ring_model.get_boxers() == (sample_boxer2,)
+
+
+##################################################
+# Fight Test Cases
+##################################################
+
+
+def test_fight_records_results_in_one_call(ring_model, sample_boxer1, sample_boxer2,
+                                           mock_update_boxer_stats_bulk, mock_get_random):
+    """Test that a fight records both results with a single bulk update."""
+    ring_model.enter_ring(sample_boxer1)
+    ring_model.enter_ring(sample_boxer2)
+
+    winner = ring_model.fight()
+
+    assert winner == 'Boxer 1'
+    mock_update_boxer_stats_bulk.assert_called_once_with([(1, 'win'), (2, 'loss')])
+    assert ring_model.get_boxers() == (), "Expected the ring to be cleared after the fight."
+
+
+def test_fight_boxer2_wins_draw(ring_model, sample_boxer1, sample_boxer2,
+                                mock_update_boxer_stats_bulk, mock_get_random):
+    """Test that boxer 2 wins when the draw is above the win probability."""
+    mock_get_random.return_value = 0.99
+    ring_model.enter_ring(sample_boxer1)
+    ring_model.enter_ring(sample_boxer2)
+
+    assert ring_model.fight() == 'Boxer 2'
+    mock_update_boxer_stats_bulk.assert_called_once_with([(2, 'win'), (1, 'loss')])
+
+
+def test_fight_lopsided_skips_draw(ring_model, sample_boxer1, mock_update_boxer_stats_bulk, mock_get_random):
+    """Test that a fight with a skill gap over 20 goes to boxer 1 without a random draw."""
+    heavyweight = Boxer(3, 'Boxer 3', 250, 76, 80.0, 30)
+    ring_model.enter_ring(heavyweight)
+    ring_model.enter_ring(sample_boxer1)
+
+    assert ring_model.fight() == 'Boxer 3'
+    mock_get_random.assert_not_called()
+    mock_update_boxer_stats_bulk.assert_called_once_with([(3, 'win'), (1, 'loss')])
+
+
+def test_fight_lopsided_favors_boxer1_even_if_weaker(ring_model, sample_boxer1, mock_update_boxer_stats_bulk,
+                                                     mock_get_random):
+    """Test that a lopsided fight goes to boxer 1 even when boxer 1 is the weaker boxer.
+
+    The win probability only depends on the size of the skill gap and always
+    favors boxer 1, so with a gap over 20 boxer 1 wins without a draw, as it
+    would have with any draw below 1.0.
+
+    """
+    heavyweight = Boxer(3, 'Boxer 3', 250, 76, 80.0, 30)
+    ring_model.enter_ring(sample_boxer1)
+    ring_model.enter_ring(heavyweight)
+
+    assert ring_model.fight() == 'Boxer 1'
+    mock_get_random.assert_not_called()
+    mock_update_boxer_stats_bulk.assert_called_once_with([(1, 'win'), (3, 'loss')])
+
+
+def test_fight_requires_two_boxers(ring_model, sample_boxer1, mock_update_boxer_stats_bulk):
+    """Test that a fight needs two boxers in the ring."""
+    ring_model.enter_ring(sample_boxer1)
+
+    with pytest.raises(ValueError, match="There must be two boxers to start a fight."):
+        ring_model.fight()
+
+    mock_update_boxer_stats_bulk.assert_not_called()
+
+
+##################################################
+# Fighting Skill Test Cases
+##################################################
+
+
+def test_get_fighting_skill(ring_model, sample_boxer1):
+    """Test the fighting skill calculation for a boxer aged 25-35."""
+    # 150 * len('Boxer 1') + 72.0 / 10 + 0
+    assert ring_model.get_fighting_skill(sample_boxer1) == pytest.approx(1057.2)
+
+
+@pytest.mark.parametrize("age, modifier", [(24, -1), (25, 0), (35, 0), (36, -2)])
+def test_get_fighting_skill_age_modifier(ring_model, age, modifier):
+    """Test that young and older boxers get an age penalty."""
+    boxer = Boxer(3, 'Boxer 3', 150, 70, 70.0, age)
+
+    assert ring_model.get_fighting_skill(boxer) == pytest.approx(150 * 7 + 7.0 + modifier)
+
+
+
+##################################################
+# Fight Kernel Test Cases
+##################################################
+
+
+def test_win_probability():
+    """Test the logistic win probability for close and lopsided fights."""
+    assert win_probability(10.0, 10.0) == pytest.approx(0.5)
+    assert win_probability(10.0, 11.0) == win_probability(11.0, 10.0)
+    assert win_probability(0.0, 20.0) < 1.0
+    assert win_probability(0.0, 20.5) == 1.0
@@ -0,0 +1,133 @@
+import sqlite3
+
+import pytest
+
+from boxing.utils import sql_utils
+from boxing.utils.sql_utils import ConnectionPool, get_db_connection
+
+
+######################################################
+#
+#    Fixtures
+#
+######################################################
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    """Point sql_utils at a fresh database with a single test table."""
+    path = str(tmp_path / "test.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT NOT NULL)")
+    conn.close()
+
+    monkeypatch.setattr(sql_utils, "DB_PATH", path)
+    return path
+
+
+def count_items(db_path: str) -> int:
+    conn = sqlite3.connect(db_path)
+    count = conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+    conn.close()
+    return count
+
+
+######################################################
+#
+#    get_db_connection
+#
+######################################################
+
+
+def test_get_db_connection_reuses_connection(db_path):
+    """Test that a connection is returned to the pool and handed out again."""
+    with get_db_connection() as conn_1:
+        pass
+    with get_db_connection() as conn_2:
+        pass
+
+    assert conn_1 is conn_2, "Expected the pooled connection to be reused."
+
+
+def test_get_db_connection_configures_connection(db_path):
+    """Test that pooled connections use WAL and autocommit mode."""
+    with get_db_connection() as conn:
+        journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+
+    assert journal_mode == "wal"
+    assert conn.isolation_level is None
+
+
+def test_get_db_connection_follows_db_path(db_path, tmp_path, monkeypatch):
+    """Test that changing DB_PATH switches the database connections are opened against."""
+    with get_db_connection() as conn:
+        assert conn.execute("SELECT name FROM sqlite_master WHERE name = 'items'").fetchone()
+
+    monkeypatch.setattr(sql_utils, "DB_PATH", str(tmp_path / "other.db"))
+
+    with get_db_connection() as conn:
+        assert conn.execute("SELECT name FROM sqlite_master WHERE name = 'items'").fetchone() is None
+
+
+def test_get_db_connection_rolls_back_on_exception(db_path):
+    """Test that an open transaction is rolled back when the block raises."""
+    with pytest.raises(ValueError, match="boom"):
+        with get_db_connection() as conn:
+            conn.execute("BEGIN")
+            conn.execute("INSERT INTO items (name) VALUES ('a')")
+            raise ValueError("boom")
+
+    assert count_items(db_path) == 0, "Expected the insert to be rolled back."
+
+    with get_db_connection() as conn:
+        assert not conn.in_transaction, "Expected the connection to be returned clean."
+
+
+def test_get_db_connection_rolls_back_uncommitted(db_path):
+    """Test that a transaction left open without an error is not committed."""
+    with get_db_connection() as conn:
+        conn.execute("BEGIN")
+        conn.execute("INSERT INTO items (name) VALUES ('a')")
+
+    assert count_items(db_path) == 0, "Expected the uncommitted insert to be discarded."
+
+
+def test_get_db_connection_keeps_committed(db_path):
+    """Test that committed writes are kept."""
+    with get_db_connection() as conn:
+        conn.execute("BEGIN")
+        conn.execute("INSERT INTO items (name) VALUES ('a')")
+        conn.commit()
+
+    assert count_items(db_path) == 1
+
+
+######################################################
+#
+#    ConnectionPool
+#
+######################################################
+
+
+def test_pool_times_out_when_exhausted(db_path):
+    """Test that waiting on a full pool raises instead of blocking forever."""
+    pool = ConnectionPool(db_path, max_size=1, min_size=1, timeout=0.01)
+    conn = pool.get()
+
+    with pytest.raises(sqlite3.OperationalError, match="Timed out"):
+        pool.get()
+
+    pool.put(conn)
+    assert pool.get() is conn, "Expected the returned connection to be handed out again."
+
+
+def test_pool_grows_up_to_max_size(db_path):
+    """Test that the pool opens new connections until it reaches max_size."""
+    pool = ConnectionPool(db_path, max_size=2, min_size=1, timeout=0.01)
+    conn_1 = pool.get()
+    conn_2 = pool.get()
+
+    assert conn_1 is not conn_2
+
+    with pytest.raises(sqlite3.OperationalError):
+        pool.get()